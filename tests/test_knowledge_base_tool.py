@@ -0,0 +1,113 @@
+"""Tests for the sleep knowledge base search"""
+
+import unittest
+
+from tools.knowledge_base_tool import SleepKnowledgeBaseTool, create_sleep_knowledge_tool
+
+
+def matched(results):
+    """(problem, score) pairs in result order"""
+    return [(match['problem'], match['match_score']) for match in results['matched_problems']]
+
+
+class SearchTest(unittest.TestCase):
+    """SleepKnowledgeBaseTool.search"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.kb = SleepKnowledgeBaseTool()
+
+    def test_false_starts_query(self):
+        results = self.kb.search("My baby wakes up 45 minutes after bedtime")
+
+        # Both keywords score 8, so ties follow the knowledge graph's problem order
+        self.assertEqual(matched(results), [('false_starts', 8), ('short_naps', 8)])
+        self.assertEqual(results['recommendations'][0], {
+            'type': 'immediate_action',
+            'actions': self.kb.knowledge_graph['problems']['false_starts']['solutions']['immediate']
+        })
+
+    def test_overlapping_phrases_match_once(self):
+        # "after bedtime" is a suffix of "45 minutes after bedtime" and "45 minute" a prefix of it
+        self.assertEqual(matched(self.kb.search("45 minutes after bedtime")), [('false_starts', 8), ('short_naps', 8)])
+        self.assertEqual(matched(self.kb.search("after bedtime")), [('false_starts', 8)])
+        self.assertEqual(matched(self.kb.search("45 minute naps")), [('short_naps', 8)])
+        self.assertEqual(matched(self.kb.search("early 5am wakeups")), [('early_rising', 8)])
+
+    def test_problem_names_outrank_keywords(self):
+        results = self.kb.search("short naps and split nights after bedtime")
+
+        self.assertEqual(matched(results), [('split_nights', 10), ('short_naps', 10), ('false_starts', 8)])
+
+    def test_concept_and_method_hits(self):
+        results = self.kb.search("Sleepy cues and sleep training")
+
+        self.assertEqual(matched(results), [])
+        self.assertEqual([concept['name'] for concept in results['concepts']], ['sleepy_cues'])
+        self.assertEqual([method['name'] for method in results['methods']], ['sleep_training'])
+        self.assertEqual(results['recommendations'], [])
+
+        results = self.kb.search("contact naps and night weaning")
+
+        self.assertEqual([concept['name'] for concept in results['concepts']], ['contact_naps'])
+        self.assertEqual([method['name'] for method in results['methods']], ['night_weaning'])
+
+    def test_symptom_only_query(self):
+        results = self.kb.search("Skipping naps entirely")
+
+        self.assertEqual(matched(results), [('nap_refusal', 1.5)])
+        self.assertEqual(results['recommendations'][0]['type'], 'immediate_action')
+
+    def test_age_specific_wake_windows_are_knowledge_base_records(self):
+        # Parsed minutes are kept beside the shared records, not written into them
+        expected = {'naps': '3 naps', 'wake_window': '120-150 minutes'}
+
+        self.assertEqual(self.kb.get_age_specific_info('6 months')['wake_windows'], expected)
+        self.assertEqual(self.kb.search("short naps", "6 months")['age_specific']['wake_windows'], expected)
+        self.assertEqual(self.kb.get_wake_window_minutes('6 months'), (120, 150, 135))
+
+    def test_no_match(self):
+        results = self.kb.search("tell me about the moon")
+
+        self.assertEqual(results, {
+            'matched_problems': [],
+            'concepts': [],
+            'methods': [],
+            'age_specific': None,
+            'recommendations': []
+        })
+
+
+class SleepKnowledgeToolTest(unittest.TestCase):
+    """Formatted output of the create_sleep_knowledge_tool() function"""
+
+    def setUp(self):
+        self.tool = create_sleep_knowledge_tool()
+
+    def test_false_starts_query(self):
+        response = self.tool("My baby wakes up 45 minutes after bedtime")
+
+        self.assertTrue(response.startswith("Based on the symptoms described, here are possible issues:\n\n**False Starts**: "))
+        self.assertLess(response.index("**False Starts**"), response.index("**Short Naps**"))
+        self.assertIn("Immediate steps to try:\n- Check wake window before bedtime\n", response)
+
+    def test_symptom_only_query(self):
+        response = self.tool("skipping naps   ENTIRELY")
+
+        self.assertEqual(response, (
+            "Based on the symptoms described, here are possible issues:\n\n"
+            "**Nap Refusal**: Resistance or inability to fall asleep at nap time\n\n"
+            "Immediate steps to try:\n"
+            "- Adjust wake windows\n"
+            "- Ensure consistent nap routine\n"
+            "- Create optimal sleep environment"
+        ))
+
+    def test_no_match(self):
+        response = self.tool("tell me about the moon")
+
+        self.assertTrue(response.startswith("I couldn't find specific information for that query."))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+"""Tests for the wake window assessment tool"""
+
+import unittest
+from itertools import product
+
+from tools.knowledge_base_tool import SleepKnowledgeBaseTool
+from tools.wake_window_assessment_tool import (
+    _DECISION_TABLE,
+    assess_wake_window_adjustment,
+    assess_wake_window_adjustment_batch,
+    get_baseline_wake_windows
+)
+
+SLEEP_TYPES = ["independent", "assisted"]
+PUTDOWN_BEHAVIORS = ["cries_immediately", "plays_fusses_long", "calm"]
+WAKE_MOODS = ["crying", "happy", "neutral"]
+NIGHT_PATTERNS = ["frequent_wakings", "split_nights", "normal"]
+
+
+def reference_assessment(sleep_type, putdown_behavior, time_to_sleep_minutes, is_bedtime,
+                         wake_mood, nap_duration_minutes, night_pattern, crying_before_offered):
+    """The original if/elif decision tree, transcribed as the reference.
+    
+    Returns:
+        Tuple of (adjustment_minutes, assessment, reason without the window id)
+    """
+    adjustment_minutes, assessment, reason = 0, "unclear", "incomplete data"
+
+    if sleep_type == "independent":
+        if putdown_behavior == "cries_immediately":
+            adjustment_minutes, assessment, reason = -15, "overtired", "crying immediately = overtired"
+        elif putdown_behavior == "plays_fusses_long" or time_to_sleep_minutes > 20:
+            adjustment_minutes, assessment, reason = 15, "undertired", "playing/slow to sleep = undertired"
+        elif time_to_sleep_minutes <= 20:
+            if is_bedtime and night_pattern:
+                if night_pattern == "frequent_wakings":
+                    adjustment_minutes, assessment, reason = -15, "overtired", "frequent night wakings + crying = overtired"
+                elif night_pattern == "split_nights":
+                    adjustment_minutes, assessment, reason = 15, "undertired", "split nights (happy wake) = undertired"
+                else:
+                    adjustment_minutes, assessment, reason = 0, "optimal", "fell asleep calmly <20min"
+            elif nap_duration_minutes is not None and not is_bedtime:
+                if nap_duration_minutes < 60 and wake_mood == "crying":
+                    adjustment_minutes, assessment, reason = -15, "overtired", "short nap + crying = overtired"
+                elif nap_duration_minutes < 60 and wake_mood == "happy":
+                    adjustment_minutes, assessment, reason = 15, "undertired", "short nap + happy = undertired"
+                elif nap_duration_minutes >= 60:
+                    adjustment_minutes, assessment, reason = 0, "optimal", "60+ min nap = optimal timing"
+            else:
+                adjustment_minutes, assessment, reason = 0, "optimal", "fell asleep calmly <20min"
+
+    elif sleep_type == "assisted":
+        if crying_before_offered:
+            adjustment_minutes, assessment, reason = -15, "overtired", "crying before offered = overtired"
+        else:
+            if is_bedtime and night_pattern:
+                if night_pattern == "frequent_wakings":
+                    adjustment_minutes, assessment, reason = -15, "overtired", "frequent night wakings = overtired"
+                elif night_pattern == "split_nights":
+                    adjustment_minutes, assessment, reason = 15, "undertired", "split nights = undertired"
+
+            if time_to_sleep_minutes < 15:
+                adjustment_minutes, assessment, reason = 0, "optimal", "calm + quick sleep = perfect window"
+            elif time_to_sleep_minutes > 20:
+                adjustment_minutes, assessment, reason = 15, "undertired", "calm but slow sleep = undertired"
+            else:
+                adjustment_minutes, assessment, reason = 0, "optimal", "calm + reasonable time = good window"
+
+    return adjustment_minutes, assessment, reason
+
+
+def reference_baseline(age_months):
+    """The original age ladder and wake window parsing, transcribed as the reference"""
+    if age_months <= 3:
+        age_str = "0-3 months"
+    elif age_months == 4:
+        age_str = "4 months"
+    elif age_months == 5:
+        age_str = "5 months"
+    elif age_months == 6:
+        age_str = "6 months"
+    elif age_months == 7:
+        age_str = "7 months"
+    elif age_months == 8:
+        age_str = "8 months"
+    elif age_months == 9:
+        age_str = "9 months"
+    elif age_months <= 12:
+        age_str = "10-12 months"
+    elif age_months <= 15:
+        age_str = "12-15 months"
+    elif age_months <= 18:
+        age_str = "15-18 months"
+    elif age_months <= 24:
+        age_str = "18-24 months"
+    else:
+        age_str = "24+ months"
+
+    wake_windows = SleepKnowledgeBaseTool().get_age_specific_info(age_str)['wake_windows']
+    wake_window_str = wake_windows['wake_window']
+    if '-' in wake_window_str:
+        parts = wake_window_str.replace(' minutes', '').split('-')
+        min_minutes = int(parts[0])
+        max_minutes = int(parts[1])
+    else:
+        min_minutes = max_minutes = int(wake_window_str.replace(' minutes', ''))
+
+    return {
+        "status": "success",
+        "age_months": age_months,
+        "age_range": age_str,
+        "wake_window_range": wake_window_str,
+        "min_minutes": min_minutes,
+        "max_minutes": max_minutes,
+        "average_minutes": (min_minutes + max_minutes) // 2,
+        "number_of_naps": wake_windows['naps'],
+        "source": "sleep_knowledge_base"
+    }
+
+
+class DecisionTableTest(unittest.TestCase):
+    """_DECISION_TABLE against the original decision tree"""
+
+    def test_table_covers_every_bucket_combination(self):
+        self.assertEqual(len(_DECISION_TABLE), 2 * 3 * 2 * 3 * 3 * 3 * 2 * 3)
+
+    def test_matches_reference_tree(self):
+        # Minute values sit on and around every bucket boundary
+        scenarios = product(
+            SLEEP_TYPES,
+            PUTDOWN_BEHAVIORS,
+            [0, 14, 14.5, 15, 20, 20.5, 21, 45],
+            [False, True],
+            WAKE_MOODS,
+            [None, 0, 30, 59, 59.5, 60, 90],
+            NIGHT_PATTERNS,
+            [False, True]
+        )
+
+        for scenario in scenarios:
+            adjustment_minutes, assessment, reason = reference_assessment(*scenario)
+            result = assess_wake_window_adjustment("nap1", *scenario)
+            self.assertEqual(
+                (result["adjustment_minutes"], result["assessment"], result["reason"]),
+                (adjustment_minutes, assessment, f"nap1: {reason}"),
+                scenario
+            )
+
+
+class BaselineWakeWindowsTest(unittest.TestCase):
+    """get_baseline_wake_windows against the original age ladder"""
+
+    def test_matches_reference_ladder(self):
+        ages = list(range(-2, 31)) + [-0.5, 0.0, 3.5, 4.5, 6.0, 9.5, 12.0, 12.5, 24.0, 24.5, 25.5, 36.0]
+
+        for age_months in ages:
+            self.assertEqual(get_baseline_wake_windows(age_months), reference_baseline(age_months), age_months)
+
+    def test_integral_floats_match_ints(self):
+        for age_months in [4, 6, 9, 12, 24]:
+            result = get_baseline_wake_windows(float(age_months))
+
+            self.assertEqual(result["age_range"], get_baseline_wake_windows(age_months)["age_range"], age_months)
+            self.assertIsInstance(result["age_months"], float)
+
+
+class BatchAssessmentTest(unittest.TestCase):
+    """assess_wake_window_adjustment_batch against the single assessment"""
+
+    def test_matches_single_assessment(self):
+        scenarios = list(product(
+            SLEEP_TYPES,
+            PUTDOWN_BEHAVIORS,
+            [0, 14.5, 15, "20", 20.5, 21],
+            [False, True],
+            WAKE_MOODS,
+            [None, 30, "59.5", 60],
+            NIGHT_PATTERNS,
+            [False, True]
+        ))
+
+        result = assess_wake_window_adjustment_batch(*zip(*scenarios), include_reasons=True)
+
+        for index, scenario in enumerate(scenarios):
+            single = assess_wake_window_adjustment("nap1", *scenario)
+            self.assertEqual(result["adjustment_minutes"][index], single["adjustment_minutes"], scenario)
+            self.assertEqual(result["assessment"][index], single["assessment"], scenario)
+            self.assertEqual("nap1: " + result["reason"][index], single["reason"], scenario)
+
+    def test_optional_columns_use_defaults(self):
+        result = assess_wake_window_adjustment_batch(["assisted", "independent"], ["calm", "calm"], [10, 25])
+
+        self.assertEqual(result, {
+            "adjustment_minutes": [0, 15],
+            "assessment": ["optimal", "undertired"]
+        })
+
+    def test_invalid_values_raise_value_error(self):
+        invalid = [
+            (["bogus"], ["calm"], [10]),
+            (["assisted"], ["calm"], ["soon"]),
+            (["assisted"], ["calm"], [None]),
+            (["independent"], ["calm"], [10], None, None, ["long"]),
+            ([["assisted"]], ["calm"], [10]),
+        ]
+        for columns in invalid:
+            with self.assertRaises(ValueError, msg=repr(columns)):
+                assess_wake_window_adjustment_batch(*columns)
+
+    def test_mismatched_columns_raise_value_error(self):
+        with self.assertRaises(ValueError):
+            assess_wake_window_adjustment_batch(["assisted"], ["calm", "calm"], [10])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,45 @@
+"""Tests for the wake window calculator tools"""
+
+import unittest
+
+try:
+    from tools.wake_window_tools import calculate_daily_schedules
+except ImportError:
+    # The calculator tools need google-adk
+    calculate_daily_schedules = None
+
+
+@unittest.skipIf(calculate_daily_schedules is None, "google-adk is not installed")
+class DailySchedulesTest(unittest.TestCase):
+    """calculate_daily_schedules for several candidate wake window sets"""
+
+    def test_one_schedule_per_option(self):
+        result = calculate_daily_schedules("07:00", [[120, 150, 180], [105, 135, 165]], 2)
+
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["total_schedules"], 2)
+        self.assertEqual(result["schedules"][0], [
+            {"event": "Morning Wake", "time": "07:00"},
+            {"event": "Nap 1", "time": "09:00", "wake_window": "120min"},
+            {"event": "Wake from Nap 1", "time": "10:30", "duration": "90min"},
+            {"event": "Nap 2", "time": "13:00", "wake_window": "150min"},
+            {"event": "Wake from Nap 2", "time": "14:00", "duration": "60min"},
+            {"event": "Bedtime", "time": "17:00", "wake_window": "180min"}
+        ])
+        self.assertEqual(result["schedules"][1][-1], {"event": "Bedtime", "time": "16:15", "wake_window": "165min"})
+
+    def test_fractional_wake_windows(self):
+        result = calculate_daily_schedules("07:00", [[120.5, 150.0]], 1)
+
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["schedules"][0][-1], {"event": "Bedtime", "time": "13:00", "wake_window": "150.0min"})
+
+    def test_invalid_wake_time(self):
+        for wake_time in ["7am", "24:00", "07:60", "007:00", "\u0660\u0667:\u0660\u0660", "\uff10\uff17:00"]:
+            result = calculate_daily_schedules(wake_time, [[120]], 0)
+
+            self.assertEqual(result["status"], "error", wake_time)
+
+
+if __name__ == "__main__":
+    unittest.main()
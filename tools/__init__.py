@@ -0,0 +1 @@
+"""Tools used by the sleep agent and its wake window specialist"""
@@ -1,25 +1,93 @@
 """Sleep Knowledge Base Tool for ADK Agent"""
 
-import json
 import os
-from typing import Dict, List, Any, Optional
+import re
+import sys
+import threading
+from collections import Counter, deque
+from functools import lru_cache
+from heapq import nlargest
+from io import StringIO
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from pathlib import Path
+from types import MappingProxyType
+
+import orjson
+
+# Parsed knowledge graphs keyed by path, with the file mtime they were read at
+_KNOWLEDGE_GRAPH_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# Stand-in for problems without solutions; the shared knowledge graph is never modified
+_NO_SOLUTIONS: Mapping[str, Any] = MappingProxyType({})
+
+# Age-specific lines of the search response
+_WAKE_WINDOW_FMT = "\n- Wake windows: %s\n- Expected naps: %s"
+_SCHEDULE_FMT = "\n- Total sleep needed: %s\n- Night sleep: %s\n- Day sleep: %s"
+
+
+def _load_knowledge_graph(knowledge_path: str) -> Dict[str, Any]:
+    """Parse the knowledge graph JSON, reusing the cached parse if the file is unchanged"""
+    path = Path(knowledge_path).resolve()
+    mtime = path.stat().st_mtime
+    cached = _KNOWLEDGE_GRAPH_CACHE.get(str(path))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    knowledge_graph = orjson.loads(path.read_bytes())
+    _KNOWLEDGE_GRAPH_CACHE[str(path)] = (mtime, knowledge_graph)
+    return knowledge_graph
+
+
+def _parse_minutes_range(text: str) -> Optional[Tuple[int, int]]:
+    """Parse a wake window like "120-150 minutes" or "90 minutes" into (min, max)"""
+    parts = text.replace(' minutes', '').split('-')
+    try:
+        if len(parts) == 1:
+            minutes = int(parts[0])
+            return minutes, minutes
+        return int(parts[0]), int(parts[1])
+    except ValueError:
+        return None
+
 
 class SleepKnowledgeBaseTool:
     """Tool for accessing sleep knowledge graph"""
     
+    # Problem-specific keywords: (phrase, problem, match score)
+    _TRIGGER_RULES = [
+        ('2 hours', 'split_nights', 8),
+        ('middle of the night', 'split_nights', 8),
+        ('30 minute', 'short_naps', 8),
+        ('45 minute', 'short_naps', 8),
+        ('5am', 'early_rising', 8),
+        ('5 am', 'early_rising', 8),
+        ('early', 'early_rising', 8),
+        ('45 minutes after bedtime', 'false_starts', 8),
+        ('after bedtime', 'false_starts', 8),
+    ]
+    
     def __init__(self, knowledge_path: str = None):
         if knowledge_path is None:
             # Look for knowledge base in the deployment structure
             base_dir = os.path.dirname(os.path.dirname(__file__))
             knowledge_path = os.path.join(base_dir, 'knowledge_base', 'sleep_knowledge_graph.json')
         
-        with open(knowledge_path, 'r') as f:
-            self.knowledge_graph = json.load(f)
+        # Parsed graph is shared between instances loading the same file
+        self.knowledge_graph = _load_knowledge_graph(knowledge_path)
+        self._intern_keys()
         
         # Create quick lookup indices
         self._build_indices()
     
+    def _intern_keys(self):
+        """Intern problem, concept and method names so lookups compare by identity"""
+        for section in ('problems', 'concepts', 'sleep_methods'):
+            self.knowledge_graph[section] = {
+                sys.intern(key): value for key, value in self.knowledge_graph[section].items()
+            }
+    
     def _build_indices(self):
         """Build indices for fast lookup"""
         self.problem_index = {}
@@ -27,47 +95,132 @@ class SleepKnowledgeBaseTool:
         self.symptom_index = {}
         self.concept_index = {}
         
-        # Index problems by symptoms
+        # Index problems by symptoms and age groups in a single pass
         for problem_name, problem_data in self.knowledge_graph['problems'].items():
             for symptom in problem_data.get('symptoms', []):
-                symptom_key = symptom.lower()
-                if symptom_key not in self.symptom_index:
-                    self.symptom_index[symptom_key] = []
-                self.symptom_index[symptom_key].append(problem_name)
-        
-        # Index by age groups
-        for problem_name, problem_data in self.knowledge_graph['problems'].items():
+                self.symptom_index.setdefault(sys.intern(symptom.lower()), []).append(problem_name)
             for age_group in problem_data.get('age_groups_affected', []):
-                if age_group not in self.age_index:
-                    self.age_index[age_group] = []
-                self.age_index[age_group].append(problem_name)
-    
-    def find_problem_by_symptoms(self, symptoms: List[str]) -> List[Dict[str, Any]]:
-        """Find problems matching given symptoms"""
-        matched_problems = {}
-        
-        for symptom in symptoms:
-            symptom_lower = symptom.lower()
-            # Check exact matches first
-            if symptom_lower in self.symptom_index:
-                for problem in self.symptom_index[symptom_lower]:
-                    if problem not in matched_problems:
-                        matched_problems[problem] = 0
-                    matched_problems[problem] += 1
-            
-            # Check partial matches
-            for indexed_symptom, problems in self.symptom_index.items():
-                if symptom_lower in indexed_symptom or indexed_symptom in symptom_lower:
-                    for problem in problems:
-                        if problem not in matched_problems:
-                            matched_problems[problem] = 0
-                        matched_problems[problem] += 0.5
-        
-        # Sort by relevance
-        sorted_problems = sorted(matched_problems.items(), key=lambda x: x[1], reverse=True)
+                self.age_index.setdefault(sys.intern(age_group), []).append(problem_name)
+        
+        # Parse wake window ranges once so callers don't re-parse the strings.
+        # Kept beside the shared records as (min, max, average) per age range.
+        self._wake_window_minutes = {}
+        for age_range, wake_window in self.knowledge_graph['age_specific_data']['wake_windows'].items():
+            parsed = _parse_minutes_range(wake_window.get('wake_window', ''))
+            if parsed is not None:
+                self._wake_window_minutes[age_range] = parsed + ((parsed[0] + parsed[1]) // 2,)
+        
+        # Indices are read-only from here on, so store deduplicated tuples
+        self.symptom_index = {key: tuple(dict.fromkeys(problems)) for key, problems in self.symptom_index.items()}
+        self.age_index = {key: tuple(dict.fromkeys(problems)) for key, problems in self.age_index.items()}
+        
+        # Precompute display forms of problem, concept and method names so the
+        # search and formatting paths don't rebuild them per query
+        names = list(chain(
+            self.knowledge_graph['problems'],
+            self.knowledge_graph['concepts'],
+            self.knowledge_graph['sleep_methods']
+        ))
+        self._display_name = {name: name.replace('_', ' ').lower() for name in names}
+        self._title_name = {name: name.replace('_', ' ').title() for name in names}
+        
+        # Lowercased concept names for fuzzy lookups in get_concept
+        self._concept_choices = [(name.lower(), name) for name in self.knowledge_graph['concepts']]
+        
+        # Resolve every age key used in the knowledge base up front
+        self._age_lookup = {
+            age: self._match_age(age)
+            for age in chain(
+                self.knowledge_graph['age_specific_data']['wake_windows'],
+                self.knowledge_graph['age_specific_data']['schedules'],
+                self.knowledge_graph['developmental_milestones']['sleep_regressions'],
+                self.age_index
+            )
+        }
         
+        # Compile every phrase search() looks for into one regex. Each phrase maps to
+        # the (rank, kind, name, score) hits it triggers. Name and keyword hits rank
+        # by the problem's position in the knowledge graph, so tied problems keep
+        # that order; concepts, methods and symptoms follow in listed order.
+        problems = self.knowledge_graph['problems']
+        problem_rank = {name: rank for rank, name in enumerate(problems)}
+        phrase_entries = chain(
+            ((self._display_name[name], (problem_rank[name], 'problem', name, 10)) for name in problems),
+            ((phrase, (problem_rank[name], 'problem', name, score))
+             for phrase, name, score in self._TRIGGER_RULES if name in problems)
+        )
+        other_entries = chain(
+            ((self._display_name[name], ('concept', name, None)) for name in self.knowledge_graph['concepts']),
+            ((self._display_name[name], ('method', name, None)) for name in self.knowledge_graph['sleep_methods']),
+            ((symptom, ('symptom', symptom, None)) for symptom in self.symptom_index)
+        )
+        phrase_entries = chain(
+            phrase_entries,
+            ((phrase, (rank,) + hit) for rank, (phrase, hit) in enumerate(other_entries, len(problems)))
+        )
+        phrase_hits = {}
+        for phrase, hit in phrase_entries:
+            phrase_hits.setdefault(phrase, []).append(hit)
+        
+        # The regex reports only the longest phrase at each position, so a match
+        # also carries the hits of every shorter phrase that is its prefix
+        self._phrase_hits = {
+            phrase: [hit for other, hits in phrase_hits.items() if phrase.startswith(other) for hit in hits]
+            for phrase in phrase_hits
+        }
+        # Zero-width lookahead so overlapping phrases are all found in one scan
+        alternation = '|'.join(re.escape(phrase) for phrase in sorted(phrase_hits, key=len, reverse=True))
+        self._phrase_re = re.compile(f'(?=({alternation}))')
+        
+        # Character trigram index over symptoms for partial matching
+        self._symptom_trigram_index = {}
+        self._short_symptoms = []
+        for symptom_key in self.symptom_index:
+            if len(symptom_key) < 3:
+                self._short_symptoms.append(symptom_key)
+            for i in range(len(symptom_key) - 2):
+                self._symptom_trigram_index.setdefault(symptom_key[i:i + 3], set()).add(symptom_key)
+        self._symptom_order = {symptom_key: i for i, symptom_key in enumerate(self.symptom_index)}
+        
+        # Score each indexed symptom contributes when found in a query, as
+        # find_problem_by_symptoms would award it
+        self._symptom_scores = {}
+        for symptom_key in self.symptom_index:
+            scores = Counter()
+            self._add_symptom_scores(symptom_key, scores)
+            self._symptom_scores[symptom_key] = scores
+    
+    def _symptom_candidates(self, symptom_lower: str) -> List[str]:
+        """Indexed symptoms that may contain, or be contained in, the given symptom"""
+        if len(symptom_lower) < 3:
+            # No trigrams to filter on - any indexed symptom may contain it
+            return list(self.symptom_index)
+        
+        candidates = set(self._short_symptoms)
+        for i in range(len(symptom_lower) - 2):
+            postings = self._symptom_trigram_index.get(symptom_lower[i:i + 3])
+            if postings:
+                candidates.update(postings)
+        
+        # Keep index order so tie-breaking between equal scores is unchanged
+        return sorted(candidates, key=self._symptom_order.__getitem__)
+    
+    def _add_symptom_scores(self, symptom_lower: str, scores: Counter):
+        """Add the exact and partial match scores of one lowercase symptom"""
+        # Check exact matches first
+        for problem in self.symptom_index.get(symptom_lower, ()):
+            scores[problem] += 1
+        
+        # Check partial matches
+        for indexed_symptom in self._symptom_candidates(symptom_lower):
+            if symptom_lower in indexed_symptom or indexed_symptom in symptom_lower:
+                for problem in self.symptom_index[indexed_symptom]:
+                    scores[problem] += 0.5
+    
+    def _top_problems(self, scores: Counter) -> List[Dict[str, Any]]:
+        """Top 3 matches by relevance"""
         results = []
-        for problem_name, score in sorted_problems[:3]:  # Top 3 matches
+        for problem_name, score in nlargest(3, scores.items(), key=itemgetter(1)):
             problem_data = self.knowledge_graph['problems'][problem_name]
             results.append({
                 'problem': problem_name,
@@ -77,6 +230,14 @@ class SleepKnowledgeBaseTool:
         
         return results
     
+    def find_problem_by_symptoms(self, symptoms: List[str]) -> List[Dict[str, Any]]:
+        """Find problems matching given symptoms"""
+        matched_problems = Counter()
+        for symptom in symptoms:
+            self._add_symptom_scores(symptom.lower(), matched_problems)
+        
+        return self._top_problems(matched_problems)
+    
     def get_solutions_for_problem(self, problem_name: str) -> Optional[Dict[str, Any]]:
         """Get solutions for a specific problem"""
         if problem_name in self.knowledge_graph['problems']:
@@ -89,44 +250,61 @@ class SleepKnowledgeBaseTool:
             }
         return None
     
-    def get_age_specific_info(self, age: str) -> Dict[str, Any]:
-        """Get age-specific sleep information"""
-        result = {
-            'wake_windows': None,
-            'schedule': None,
-            'common_problems': [],
-            'developmental_considerations': []
-        }
+    def _match_age(self, age: str) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]], List[str]]:
+        """Scan the age-keyed tables for the wake windows, schedule and regressions matching an age"""
+        wake_windows = None
+        schedule = None
         
         # Find wake windows
-        wake_windows = self.knowledge_graph['age_specific_data']['wake_windows']
-        for age_range, data in wake_windows.items():
+        for age_range, data in self.knowledge_graph['age_specific_data']['wake_windows'].items():
             if age in age_range or age_range in age:
-                result['wake_windows'] = data
+                wake_windows = data
                 break
         
         # Find schedule
-        schedules = self.knowledge_graph['age_specific_data']['schedules']
-        for age_key, schedule in schedules.items():
+        for age_key, data in self.knowledge_graph['age_specific_data']['schedules'].items():
             if age in age_key or age_key in age:
-                result['schedule'] = schedule
+                schedule = data
                 break
         
-        # Find common problems for this age
-        if age in self.age_index:
-            result['common_problems'] = self.age_index[age]
-        
         # Check for relevant regressions
+        regressions = [
+            regression_name
+            for regression_name in self.knowledge_graph['developmental_milestones']['sleep_regressions']
+            if age in regression_name or regression_name in age
+        ]
+        
+        return wake_windows, schedule, regressions
+    
+    def get_wake_window_minutes(self, age: str) -> Optional[Tuple[int, int, int]]:
+        """Parsed (min, max, average) minutes of the wake window get_age_specific_info returns for an age"""
+        for age_range in self.knowledge_graph['age_specific_data']['wake_windows']:
+            if age in age_range or age_range in age:
+                return self._wake_window_minutes.get(age_range)
+        return None
+    
+    def get_age_specific_info(self, age: str) -> Dict[str, Any]:
+        """Get age-specific sleep information"""
+        # Ages spelled like a knowledge base key resolve from the prebuilt table
+        matched = self._age_lookup.get(age)
+        if matched is None:
+            matched = self._match_age(age)
+        wake_windows, schedule, regression_names = matched
+        
         regressions = self.knowledge_graph['developmental_milestones']['sleep_regressions']
-        for regression_name, regression_data in regressions.items():
-            if age in regression_name or regression_name in age:
-                result['developmental_considerations'].append({
+        return {
+            'wake_windows': wake_windows,
+            'schedule': schedule,
+            'common_problems': list(self.age_index.get(age, ())),
+            'developmental_considerations': [
+                {
                     'type': 'sleep_regression',
                     'name': regression_name,
-                    'data': regression_data
-                })
-        
-        return result
+                    'data': regressions[regression_name]
+                }
+                for regression_name in regression_names
+            ]
+        }
     
     def get_sleep_method(self, method_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific sleep training method"""
@@ -153,9 +331,10 @@ class SleepKnowledgeBaseTool:
             return concepts[concept_name]
         
         # Fuzzy match
-        for key, value in concepts.items():
-            if concept_name.lower() in key.lower() or key.lower() in concept_name.lower():
-                return value
+        concept_lower = concept_name.lower()
+        for key_lower, key in self._concept_choices:
+            if concept_lower in key_lower or key_lower in concept_lower:
+                return concepts[key]
         
         return None
     
@@ -164,15 +343,19 @@ class SleepKnowledgeBaseTool:
         if start_problem not in self.knowledge_graph['problems']:
             return []
         
+        problems = self.knowledge_graph['problems']
         visited = set()
         path = []
         
-        def dfs(current_problem: str, depth: int = 0):
+        # Breadth-first walk over related problems, up to 3 hops away
+        queue = deque([(start_problem, 0)])
+        while queue:
+            current_problem, depth = queue.popleft()
             if depth > 3 or current_problem in visited:
-                return
+                continue
             
             visited.add(current_problem)
-            problem_data = self.knowledge_graph['problems'].get(current_problem, {})
+            problem_data = problems.get(current_problem, {})
             
             if target_type == 'solution' and 'solutions' in problem_data:
                 path.append({
@@ -181,10 +364,8 @@ class SleepKnowledgeBaseTool:
                 })
             
             # Explore related problems
-            for related in problem_data.get('related_problems', []):
-                dfs(related, depth + 1)
+            queue.extend((related, depth + 1) for related in problem_data.get('related_problems', []))
         
-        dfs(start_problem)
         return path
     
     def search(self, query: str, child_age: Optional[str] = None) -> Dict[str, Any]:
@@ -198,72 +379,52 @@ class SleepKnowledgeBaseTool:
             'recommendations': []
         }
         
-        # Direct problem name matching
-        for problem_name, problem_data in self.knowledge_graph['problems'].items():
-            problem_words = problem_name.replace('_', ' ').lower()
-            # Check if problem name appears in query
-            if problem_words in query_lower:
-                results['matched_problems'].append({
-                    'problem': problem_name,
-                    'match_score': 10,  # High score for direct match
-                    'data': problem_data
-                })
-            # Check problem-specific keywords
-            elif problem_name == 'split_nights' and ('2 hours' in query_lower or 'middle of the night' in query_lower):
-                results['matched_problems'].append({
-                    'problem': problem_name,
-                    'match_score': 8,
-                    'data': problem_data
-                })
-            elif problem_name == 'short_naps' and ('30 minute' in query_lower or '45 minute' in query_lower):
-                results['matched_problems'].append({
-                    'problem': problem_name,
-                    'match_score': 8,
-                    'data': problem_data
-                })
-            elif problem_name == 'early_rising' and ('5am' in query_lower or '5 am' in query_lower or 'early' in query_lower):
-                results['matched_problems'].append({
-                    'problem': problem_name,
-                    'match_score': 8,
-                    'data': problem_data
-                })
-            elif problem_name == 'false_starts' and ('45 minutes after bedtime' in query_lower or 'after bedtime' in query_lower):
-                results['matched_problems'].append({
-                    'problem': problem_name,
-                    'match_score': 8,
-                    'data': problem_data
-                })
+        # Find problem names, keywords, concepts, methods and symptoms in a single scan
+        hits = set()
+        for match in self._phrase_re.finditer(query_lower):
+            hits.update(self._phrase_hits[match.group(1)])
         
-        # Extract potential symptoms from query
+        problems = self.knowledge_graph['problems']
+        matched = {}
         symptoms = []
-        for problem_data in self.knowledge_graph['problems'].values():
-            for symptom in problem_data.get('symptoms', []):
-                if symptom.lower() in query_lower:
-                    symptoms.append(symptom)
-        
-        # Find problems by symptoms if no direct matches
-        if symptoms and not results['matched_problems']:
-            results['matched_problems'] = self.find_problem_by_symptoms(symptoms)
-        
-        # Check for concept matches
-        for concept_name in self.knowledge_graph['concepts']:
-            if concept_name.replace('_', ' ') in query_lower:
-                concept_data = self.get_concept(concept_name)
+        for _, kind, name, score in sorted(hits):
+            if kind == 'problem':
+                # One entry per problem, keeping its best score
+                previous = matched.get(name)
+                if previous is None or previous['match_score'] < score:
+                    matched[name] = {
+                        'problem': name,
+                        'match_score': score,
+                        'data': problems[name]
+                    }
+            
+            elif kind == 'concept':
+                concept_data = self.get_concept(name)
                 if concept_data:
                     results['concepts'].append({
-                        'name': concept_name,
+                        'name': name,
                         'data': concept_data
                     })
-        
-        # Check for method matches
-        for method_name in self.knowledge_graph['sleep_methods']:
-            if method_name.replace('_', ' ') in query_lower:
-                method_data = self.get_sleep_method(method_name)
+            
+            elif kind == 'method':
+                method_data = self.get_sleep_method(name)
                 if method_data:
                     results['methods'].append({
-                        'name': method_name,
+                        'name': name,
                         'data': method_data
                     })
+            
+            elif kind == 'symptom':
+                symptoms.append(name)
+        
+        results['matched_problems'] = sorted(matched.values(), key=itemgetter('match_score'), reverse=True)
+        
+        # Find problems by symptoms mentioned in the query if no direct matches
+        if not results['matched_problems']:
+            matched_problems = Counter()
+            for symptom in symptoms:
+                matched_problems.update(self._symptom_scores[symptom])
+            results['matched_problems'] = self._top_problems(matched_problems)
         
         # Add age-specific information if provided
         if child_age:
@@ -272,15 +433,15 @@ class SleepKnowledgeBaseTool:
         # Generate recommendations based on findings
         if results['matched_problems']:
             top_problem = results['matched_problems'][0]
-            solutions = top_problem['data'].get('solutions', {})
+            solutions = top_problem['data'].get('solutions', _NO_SOLUTIONS)
             
-            if 'immediate' in solutions:
+            if solutions.get('immediate'):
                 results['recommendations'].append({
                     'type': 'immediate_action',
                     'actions': solutions['immediate']
                 })
             
-            if 'long_term' in solutions:
+            if solutions.get('long_term'):
                 results['recommendations'].append({
                     'type': 'long_term_plan',
                     'actions': solutions['long_term']
@@ -289,68 +450,100 @@ class SleepKnowledgeBaseTool:
         return results
 
 
+# Shared knowledge base instance, built on first use by get_kb()
+_KB: Optional[SleepKnowledgeBaseTool] = None
+_KB_LOCK = threading.Lock()
+
+
+def get_kb() -> SleepKnowledgeBaseTool:
+    """Shared knowledge base instance for all tools, built once on first use"""
+    global _KB
+    if _KB is None:
+        with _KB_LOCK:
+            if _KB is None:
+                _KB = SleepKnowledgeBaseTool()
+    return _KB
+
+
 # Create tool function for ADK agent
 def create_sleep_knowledge_tool():
     """Create a tool function that can be used by ADK agent"""
-    kb = SleepKnowledgeBaseTool()
     
-    def sleep_knowledge_search(query: str, child_age: Optional[str] = None) -> str:
-        """
-        Search the sleep knowledge base for information.
-        
-        Args:
-            query: The sleep-related question or symptoms
-            child_age: Optional age of the child (e.g., "6 months", "2 years")
-        
-        Returns:
-            Relevant sleep information and recommendations
-        """
+    # Responses are deterministic for a given knowledge base, so cache them per query
+    @lru_cache(maxsize=512)
+    def format_search_response(query: str, child_age: Optional[str]) -> str:
+        """Run a search and format the results for a normalized query"""
+        kb = get_kb()
         results = kb.search(query, child_age)
         
-        # Format results for agent response
-        response_parts = []
+        # Format results for agent response. Every part is written with a leading
+        # newline separator and the very first one is dropped at the end.
+        buffer = StringIO()
+        write = buffer.write
         
         if results['matched_problems']:
-            response_parts.append("Based on the symptoms described, here are possible issues:")
+            write("\nBased on the symptoms described, here are possible issues:")
             for match in results['matched_problems']:
                 problem = match['problem']
                 definition = match['data'].get('definition', '')
-                response_parts.append(f"\n**{problem.replace('_', ' ').title()}**: {definition}")
+                write(f"\n\n**{kb._title_name[problem]}**: {definition}")
                 
                 # Add immediate solutions
-                solutions = match['data'].get('solutions', {})
-                if 'immediate' in solutions:
-                    response_parts.append("\nImmediate steps to try:")
+                solutions = match['data'].get('solutions', _NO_SOLUTIONS)
+                if solutions.get('immediate'):
+                    write("\n\nImmediate steps to try:")
                     for action in solutions['immediate']:
                         if isinstance(action, dict):
-                            response_parts.append(f"- {action.get('action', '')}")
+                            write("\n- ")
+                            write(action.get('action', ''))
                             for detail in action.get('details', []):
-                                response_parts.append(f"  • {detail}")
+                                write("\n  • ")
+                                write(detail)
                         else:
-                            response_parts.append(f"- {action}")
+                            write(f"\n- {action}")
         
         if results['age_specific'] and child_age:
-            response_parts.append(f"\nFor a {child_age} old:")
-            if results['age_specific']['wake_windows']:
-                ww = results['age_specific']['wake_windows']
-                response_parts.append(f"- Wake windows: {ww.get('wake_window', 'Not specified')}")
-                response_parts.append(f"- Expected naps: {ww.get('naps', 'Not specified')}")
+            write(f"\n\nFor a {child_age} old:")
+            ww = results['age_specific']['wake_windows']
+            if ww:
+                write(_WAKE_WINDOW_FMT % (
+                    ww.get('wake_window', 'Not specified'),
+                    ww.get('naps', 'Not specified')
+                ))
             
-            if results['age_specific']['schedule']:
-                schedule = results['age_specific']['schedule']
-                response_parts.append(f"- Total sleep needed: {schedule.get('total_sleep', 'Not specified')}")
-                response_parts.append(f"- Night sleep: {schedule.get('night_sleep', 'Not specified')}")
-                response_parts.append(f"- Day sleep: {schedule.get('day_sleep', 'Not specified')}")
+            schedule = results['age_specific']['schedule']
+            if schedule:
+                write(_SCHEDULE_FMT % (
+                    schedule.get('total_sleep', 'Not specified'),
+                    schedule.get('night_sleep', 'Not specified'),
+                    schedule.get('day_sleep', 'Not specified')
+                ))
         
         if results['concepts']:
-            response_parts.append("\nRelevant information:")
+            write("\n\nRelevant information:")
             for concept in results['concepts']:
-                response_parts.append(f"\n**{concept['name'].replace('_', ' ').title()}**")
+                write(f"\n\n**{kb._title_name[concept['name']]}**")
                 # Add key points from concept
                 data = concept['data']
                 if 'definition' in data:
-                    response_parts.append(data['definition'])
+                    write("\n")
+                    write(data['definition'])
+        
+        response = buffer.getvalue()
+        return response[1:] if response else "I couldn't find specific information for that query. Could you provide more details about the sleep issue you're experiencing?"
+    
+    def sleep_knowledge_search(query: str, child_age: Optional[str] = None) -> str:
+        """
+        Search the sleep knowledge base for information.
         
-        return '\n'.join(response_parts) if response_parts else "I couldn't find specific information for that query. Could you provide more details about the sleep issue you're experiencing?"
+        Args:
+            query: The sleep-related question or symptoms
+            child_age: Optional age of the child (e.g., "6 months", "2 years")
+        
+        Returns:
+            Relevant sleep information and recommendations
+        """
+        # Normalize case and whitespace so rephrased repeats share a cache entry
+        return format_search_response(" ".join(query.lower().split()), child_age or None)
     
     return sleep_knowledge_search
\ No newline at end of file
@@ -1,14 +1,15 @@
 """Wake Window Assessment Tool - Implements the decision tree logic"""
 
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, List, Mapping, Tuple, Optional
 from enum import Enum
+from functools import lru_cache
+from itertools import product, repeat
+from types import MappingProxyType
 import json
-import os
+import re
 import sys
 
-# Add parent directory to import knowledge base
-sys.path.append(os.path.dirname(__file__))
-from knowledge_base_tool import SleepKnowledgeBaseTool
+from .knowledge_base_tool import get_kb
 
 # Enums for sleep assessment
 class SleepType(Enum):
@@ -30,6 +31,178 @@ class NightSleepPattern(Enum):
     SPLIT_NIGHTS = "split_nights"
     NORMAL = "normal"
 
+# Accepted input values, so calls can validate without constructing enums
+_VALID_SLEEP_TYPES = frozenset(member.value for member in SleepType)
+_VALID_PUTDOWN_BEHAVIORS = frozenset(member.value for member in PutDownBehavior)
+_VALID_WAKE_MOODS = frozenset(member.value for member in WakeMood)
+_VALID_NIGHT_PATTERNS = frozenset(member.value for member in NightSleepPattern)
+
+
+# Buckets of time to fall asleep and nap length that the decision tree distinguishes
+_TIME_BUCKETS = ("lt15", "15_20", "gt20")
+_NAP_BUCKETS = ("none", "lt60", "ge60")
+
+
+def _time_bucket(time_to_sleep_minutes: int) -> str:
+    """Bucket minutes taken to fall asleep: under 15, 15-20 or over 20"""
+    if time_to_sleep_minutes < 15:
+        return "lt15"
+    if time_to_sleep_minutes <= 20:
+        return "15_20"
+    return "gt20"
+
+
+def _nap_bucket(nap_duration_minutes: Optional[int]) -> str:
+    """Bucket nap length: no nap reported, under an hour or an hour or more"""
+    if nap_duration_minutes is None:
+        return "none"
+    return "lt60" if nap_duration_minutes < 60 else "ge60"
+
+
+def _as_minutes(value: Any) -> Optional[float]:
+    """Minute count as a number, parsing numeric strings; None if it isn't one.
+    
+    Numbers are returned as they are, without rounding, so fractional values
+    fall on the same side of each bucket boundary as before.
+    """
+    if isinstance(value, str):
+        try:
+            value = float(value)
+        except ValueError:
+            return None
+        return int(value) if value.is_integer() else value
+    if isinstance(value, (int, float)):
+        return value
+    return None
+
+
+# Reasons for each leaf of the decision tree, shown after "<window_id>: "
+_R_OVERTIRED_CRY = sys.intern("crying immediately = overtired")
+_R_UNDERTIRED_PLAY = sys.intern("playing/slow to sleep = undertired")
+_R_OVERTIRED_NIGHT_WAKINGS = sys.intern("frequent night wakings + crying = overtired")
+_R_UNDERTIRED_SPLIT_NIGHTS = sys.intern("split nights (happy wake) = undertired")
+_R_OPTIMAL_CALM = sys.intern("fell asleep calmly <20min")
+_R_OVERTIRED_SHORT_NAP = sys.intern("short nap + crying = overtired")
+_R_UNDERTIRED_SHORT_NAP = sys.intern("short nap + happy = undertired")
+_R_OPTIMAL_LONG_NAP = sys.intern("60+ min nap = optimal timing")
+_R_UNCLEAR = sys.intern("incomplete data")
+_R_OVERTIRED_CRY_BEFORE_OFFERED = sys.intern("crying before offered = overtired")
+_R_OPTIMAL_QUICK = sys.intern("calm + quick sleep = perfect window")
+_R_UNDERTIRED_SLOW = sys.intern("calm but slow sleep = undertired")
+_R_OPTIMAL_REASONABLE = sys.intern("calm + reasonable time = good window")
+
+
+def _decide(
+    sleep_type: str,
+    putdown_behavior: str,
+    is_bedtime: bool,
+    night_pattern: str,
+    wake_mood: str,
+    nap_bucket: str,
+    crying_before_offered: bool,
+    time_bucket: str
+) -> Tuple[int, str, str]:
+    """Walk the decision tree for one combination of bucketed inputs.
+    
+    Only used to build _DECISION_TABLE at import time.
+    
+    Returns:
+        Tuple of (adjustment_minutes, assessment, reason)
+    """
+    # INDEPENDENT SLEEP DECISION TREE
+    if sleep_type == SleepType.INDEPENDENT.value:
+        
+        # Cries immediately at putdown → overtired
+        if putdown_behavior == PutDownBehavior.CRIES_IMMEDIATELY.value:
+            return -15, "overtired", _R_OVERTIRED_CRY
+        
+        # Plays/fusses for long time OR takes >20 min → undertired
+        if putdown_behavior == PutDownBehavior.PLAYS_FUSSES_LONG.value or time_bucket == "gt20":
+            return 15, "undertired", _R_UNDERTIRED_PLAY
+        
+        # Falls asleep within 20 minutes calmly - check night sleep patterns for bedtime
+        if is_bedtime:
+            if night_pattern == NightSleepPattern.FREQUENT_WAKINGS.value:
+                return -15, "overtired", _R_OVERTIRED_NIGHT_WAKINGS
+            if night_pattern == NightSleepPattern.SPLIT_NIGHTS.value:
+                return 15, "undertired", _R_UNDERTIRED_SPLIT_NIGHTS
+            return 0, "optimal", _R_OPTIMAL_CALM
+        
+        # Check nap quality for non-bedtime windows
+        if nap_bucket != "none":
+            # Short nap (<60 min) + crying wake = overtired
+            if nap_bucket == "lt60" and wake_mood == WakeMood.CRYING.value:
+                return -15, "overtired", _R_OVERTIRED_SHORT_NAP
+            
+            # Short nap (<60 min) + happy wake = undertired
+            if nap_bucket == "lt60" and wake_mood == WakeMood.HAPPY.value:
+                return 15, "undertired", _R_UNDERTIRED_SHORT_NAP
+            
+            # Slept for more than an hour independently = optimal
+            if nap_bucket == "ge60":
+                return 0, "optimal", _R_OPTIMAL_LONG_NAP
+            
+            # Short nap with a neutral wake doesn't tell us anything
+            return 0, "unclear", _R_UNCLEAR
+        
+        # Default for independent sleep falling asleep <20min
+        return 0, "optimal", _R_OPTIMAL_CALM
+    
+    # ASSISTED SLEEP DECISION TREE
+    
+    # Crying before sleep is offered → overtired
+    if crying_before_offered:
+        return -15, "overtired", _R_OVERTIRED_CRY_BEFORE_OFFERED
+    
+    # Calm and looking around when offered sleep. Time to fall asleep decides
+    # the outcome, whatever the night pattern at bedtime.
+    
+    # Fell asleep in <15 minutes = perfect window
+    if time_bucket == "lt15":
+        return 0, "optimal", _R_OPTIMAL_QUICK
+    
+    # Taking >20 minutes to fall asleep = undertired
+    if time_bucket == "gt20":
+        return 15, "undertired", _R_UNDERTIRED_SLOW
+    
+    # 15-20 minutes
+    return 0, "optimal", _R_OPTIMAL_REASONABLE
+
+
+# Every outcome of the decision tree, keyed by
+# (sleep_type, putdown_behavior, is_bedtime, night_pattern, wake_mood,
+#  nap bucket, crying_before_offered, time bucket)
+_DECISION_TABLE: Dict[tuple, Tuple[int, str, str]] = {
+    key: _decide(*key)
+    for key in product(
+        [member.value for member in SleepType],
+        [member.value for member in PutDownBehavior],
+        (False, True),
+        [member.value for member in NightSleepPattern],
+        [member.value for member in WakeMood],
+        _NAP_BUCKETS,
+        (False, True),
+        _TIME_BUCKETS
+    )
+}
+
+# Action and its capitalized form, indexed by the sign of the adjustment
+# (0 maintain, 1 extend, -1 shorten)
+_ACTION_TABLE = (("maintain", "Maintain"), ("extend", "Extend"), ("shorten", "Shorten"))
+
+
+# Fields shared by every error response, spread into a fresh dict per error
+_ERR_TEMPLATE: Mapping[str, str] = MappingProxyType({"status": "error"})
+
+
+def _invalid_input(window_id: str, value: Any, kind: str) -> Dict[str, Any]:
+    """Error response for an input value outside its accepted set"""
+    return {
+        **_ERR_TEMPLATE,
+        "error": f"Invalid input value: {value!r} is not a valid {kind}",
+        "window_id": window_id
+    }
+
 
 def assess_wake_window_adjustment(
     window_id: str,
@@ -40,7 +213,8 @@ def assess_wake_window_adjustment(
     wake_mood: str = "neutral",
     nap_duration_minutes: Optional[int] = None,
     night_pattern: str = "normal",
-    crying_before_offered: bool = False
+    crying_before_offered: bool = False,
+    include_details: bool = False
 ) -> Dict[str, Any]:
     """Assess wake window and determine adjustment using decision tree logic.
     
@@ -56,152 +230,237 @@ def assess_wake_window_adjustment(
         nap_duration_minutes: Duration of nap in minutes (if applicable)
         night_pattern: "frequent_wakings", "split_nights", or "normal"
         crying_before_offered: For assisted sleep, was baby crying before offered
+        include_details: Whether to echo the assessed inputs back under "details"
         
     Returns:
         Dictionary with assessment results and recommendations
     """
-    try:
-        # Convert to enums
-        sleep_type_enum = SleepType(sleep_type)
-        putdown_enum = PutDownBehavior(putdown_behavior)
-        wake_mood_enum = WakeMood(wake_mood)
-        night_pattern_enum = NightSleepPattern(night_pattern)
+    # Minute counts may arrive as numeric strings from the tool call
+    minutes = _as_minutes(time_to_sleep_minutes)
+    if minutes is None:
+        return _invalid_input(window_id, time_to_sleep_minutes, "number of minutes")
+    time_to_sleep_minutes = minutes
+    if nap_duration_minutes is not None:
+        minutes = _as_minutes(nap_duration_minutes)
+        if minutes is None:
+            return _invalid_input(window_id, nap_duration_minutes, "number of minutes")
+        nap_duration_minutes = minutes
+    
+    # Validate inputs
+    if sleep_type not in _VALID_SLEEP_TYPES:
+        return _invalid_input(window_id, sleep_type, "SleepType")
+    if putdown_behavior not in _VALID_PUTDOWN_BEHAVIORS:
+        return _invalid_input(window_id, putdown_behavior, "PutDownBehavior")
+    if wake_mood not in _VALID_WAKE_MOODS:
+        return _invalid_input(window_id, wake_mood, "WakeMood")
+    if night_pattern not in _VALID_NIGHT_PATTERNS:
+        return _invalid_input(window_id, night_pattern, "NightSleepPattern")
+    
+    # Look up the decision tree outcome
+    adjustment_minutes, assessment, reason = _DECISION_TABLE[(
+        sleep_type,
+        putdown_behavior,
+        bool(is_bedtime),
+        night_pattern,
+        wake_mood,
+        _nap_bucket(nap_duration_minutes),
+        bool(crying_before_offered),
+        _time_bucket(time_to_sleep_minutes)
+    )]
+    
+    # Build response
+    action, action_title = _ACTION_TABLE[(adjustment_minutes > 0) - (adjustment_minutes < 0)]
+    response = {
+        "status": "success",
+        "window_id": window_id,
+        "assessment": assessment,
+        "adjustment_minutes": adjustment_minutes,
+        "reason": f"{window_id}: {reason}",
+        "action": action,
+        "recommendation": f"{action_title} {window_id} wake window by {abs(adjustment_minutes)} minutes"
+    }
+    
+    if include_details:
+        response["details"] = {
+            "sleep_type": sleep_type,
+            "putdown_behavior": putdown_behavior,
+            "time_to_sleep": time_to_sleep_minutes,
+            "is_bedtime": is_bedtime,
+            "wake_mood": wake_mood,
+            "nap_duration": nap_duration_minutes,
+            "night_pattern": night_pattern,
+            "crying_before_offered": crying_before_offered
+        }
+    
+    return response
+
+
+def assess_wake_window_adjustment_batch(
+    sleep_type: List[str],
+    putdown_behavior: List[str],
+    time_to_sleep_minutes: List[int],
+    is_bedtime: Optional[List[bool]] = None,
+    wake_mood: Optional[List[str]] = None,
+    nap_duration_minutes: Optional[List[Optional[int]]] = None,
+    night_pattern: Optional[List[str]] = None,
+    crying_before_offered: Optional[List[bool]] = None,
+    include_reasons: bool = False
+) -> Dict[str, List[Any]]:
+    """Assess many scenarios at once, e.g. to sweep wake window hypotheses.
+    
+    Scenarios are given as parallel columns, one value per scenario, with the
+    same meaning as the arguments of assess_wake_window_adjustment. Omitted
+    optional columns take that function's defaults. Only the outcome is
+    computed - no recommendations are formatted. With include_reasons, a
+    "reason" column holds the shared reason text of each outcome, without
+    the "<window_id>: " prefix the single assessment adds.
+    
+    Returns:
+        Dictionary with parallel "adjustment_minutes" and "assessment" columns,
+        plus "reason" if requested
         
-        # Initialize return values
-        adjustment_minutes = 0
-        assessment = "unclear"
-        reason = f"{window_id}: incomplete data"
+    Raises:
+        ValueError: If the columns differ in length or hold an invalid value
+    """
+    count = len(sleep_type)
+    given = [putdown_behavior, time_to_sleep_minutes, is_bedtime, wake_mood,
+             nap_duration_minutes, night_pattern, crying_before_offered]
+    if any(column is not None and len(column) != count for column in given):
+        raise ValueError("All scenario columns must have the same length")
+    
+    rows = zip(
+        sleep_type,
+        putdown_behavior,
+        time_to_sleep_minutes,
+        repeat(False) if is_bedtime is None else is_bedtime,
+        repeat("neutral") if wake_mood is None else wake_mood,
+        repeat(None) if nap_duration_minutes is None else nap_duration_minutes,
+        repeat("normal") if night_pattern is None else night_pattern,
+        repeat(False) if crying_before_offered is None else crying_before_offered
+    )
+    
+    adjustments = []
+    assessments = []
+    reasons = []
+    for index, (sleep, putdown, time_to_sleep, bedtime, mood, nap, night, crying) in enumerate(rows):
+        # Minute values are parsed like the single assessment does
+        time_to_sleep = _as_minutes(time_to_sleep)
+        if time_to_sleep is None:
+            raise ValueError(f"Invalid input value in scenario {index}")
+        if nap is not None:
+            nap = _as_minutes(nap)
+            if nap is None:
+                raise ValueError(f"Invalid input value in scenario {index}")
         
-        # INDEPENDENT SLEEP DECISION TREE
-        if sleep_type_enum == SleepType.INDEPENDENT:
-            
-            # Cries immediately at putdown → overtired
-            if putdown_enum == PutDownBehavior.CRIES_IMMEDIATELY:
-                adjustment_minutes = -15
-                assessment = "overtired"
-                reason = f"{window_id}: crying immediately = overtired"
-            
-            # Plays/fusses for long time OR takes >20 min → undertired
-            elif putdown_enum == PutDownBehavior.PLAYS_FUSSES_LONG or time_to_sleep_minutes > 20:
-                adjustment_minutes = 15
-                assessment = "undertired"
-                reason = f"{window_id}: playing/slow to sleep = undertired"
-            
-            # Falls asleep within 20 minutes calmly
-            elif time_to_sleep_minutes <= 20:
-                # Check night sleep patterns for bedtime
-                if is_bedtime and night_pattern_enum:
-                    if night_pattern_enum == NightSleepPattern.FREQUENT_WAKINGS:
-                        adjustment_minutes = -15
-                        assessment = "overtired"
-                        reason = f"{window_id}: frequent night wakings + crying = overtired"
-                    elif night_pattern_enum == NightSleepPattern.SPLIT_NIGHTS:
-                        adjustment_minutes = 15
-                        assessment = "undertired"
-                        reason = f"{window_id}: split nights (happy wake) = undertired"
-                    else:
-                        adjustment_minutes = 0
-                        assessment = "optimal"
-                        reason = f"{window_id}: fell asleep calmly <20min"
-                
-                # Check nap quality for non-bedtime windows
-                elif nap_duration_minutes is not None and not is_bedtime:
-                    # Short nap (<60 min) + crying wake = overtired
-                    if nap_duration_minutes < 60 and wake_mood_enum == WakeMood.CRYING:
-                        adjustment_minutes = -15
-                        assessment = "overtired"
-                        reason = f"{window_id}: short nap + crying = overtired"
-                    
-                    # Short nap (<60 min) + happy wake = undertired
-                    elif nap_duration_minutes < 60 and wake_mood_enum == WakeMood.HAPPY:
-                        adjustment_minutes = 15
-                        assessment = "undertired"
-                        reason = f"{window_id}: short nap + happy = undertired"
-                    
-                    # Slept for more than an hour independently = optimal
-                    elif nap_duration_minutes >= 60:
-                        adjustment_minutes = 0
-                        assessment = "optimal"
-                        reason = f"{window_id}: 60+ min nap = optimal timing"
-                else:
-                    # Default for independent sleep falling asleep <20min
-                    adjustment_minutes = 0
-                    assessment = "optimal"
-                    reason = f"{window_id}: fell asleep calmly <20min"
+        try:
+            outcome = _DECISION_TABLE.get((
+                sleep,
+                putdown,
+                bool(bedtime),
+                night,
+                mood,
+                _nap_bucket(nap),
+                bool(crying),
+                _time_bucket(time_to_sleep)
+            ))
+        except TypeError:
+            # Unhashable column value
+            outcome = None
+        if outcome is None:
+            raise ValueError(f"Invalid input value in scenario {index}")
+        adjustments.append(outcome[0])
+        assessments.append(outcome[1])
+        if include_reasons:
+            reasons.append(outcome[2])
+    
+    result = {
+        "adjustment_minutes": adjustments,
+        "assessment": assessments
+    }
+    if include_reasons:
+        result["reason"] = reasons
+    return result
+
+
+# Age range keys of the knowledge base wake window table, e.g. "4 months",
+# "10-12 months" or "24+ months"
+_AGE_RANGE_RE = re.compile(r"^(\d+)(?:-(\d+)|(\+))? months$")
+
+
+@lru_cache(maxsize=1)
+def _age_ranges() -> Tuple[Tuple[Tuple[str, int, bool], ...], Optional[str]]:
+    """Wake window age ranges read from the knowledge base, in listed order.
+    
+    Returns:
+        Tuple of ((label, month, exact) for each bounded range, open-ended label
+        for older children or None). A single month like "4 months" matches
+        only that age; a range like "10-12 months" matches any age up to its
+        upper month that no earlier entry matched.
+    """
+    ranges = []
+    open_ended = None
+    
+    for age_range in get_kb().knowledge_graph['age_specific_data']['wake_windows']:
+        match = _AGE_RANGE_RE.match(age_range)
+        if not match:
+            continue
         
-        # ASSISTED SLEEP DECISION TREE
-        elif sleep_type_enum == SleepType.ASSISTED:
-            
-            # Crying before sleep is offered → overtired
-            if crying_before_offered:
-                adjustment_minutes = -15
-                assessment = "overtired"
-                reason = f"{window_id}: crying before offered = overtired"
-            
-            # Calm and looking around when offered sleep
-            else:
-                # Check night patterns for bedtime assisted sleep
-                if is_bedtime and night_pattern_enum:
-                    if night_pattern_enum == NightSleepPattern.FREQUENT_WAKINGS:
-                        adjustment_minutes = -15
-                        assessment = "overtired"
-                        reason = f"{window_id}: frequent night wakings = overtired"
-                    elif night_pattern_enum == NightSleepPattern.SPLIT_NIGHTS:
-                        adjustment_minutes = 15
-                        assessment = "undertired"
-                        reason = f"{window_id}: split nights = undertired"
-                
-                # Fell asleep in <15 minutes = perfect window
-                if time_to_sleep_minutes < 15:
-                    adjustment_minutes = 0
-                    assessment = "optimal"
-                    reason = f"{window_id}: calm + quick sleep = perfect window"
-                
-                # Taking >20 minutes to fall asleep = undertired
-                elif time_to_sleep_minutes > 20:
-                    adjustment_minutes = 15
-                    assessment = "undertired"
-                    reason = f"{window_id}: calm but slow sleep = undertired"
-                
-                # 15-20 minutes
-                else:
-                    adjustment_minutes = 0
-                    assessment = "optimal"
-                    reason = f"{window_id}: calm + reasonable time = good window"
+        low, high, plus = match.groups()
+        if plus:
+            open_ended = open_ended or age_range
+        elif high:
+            ranges.append((age_range, int(high), False))
+        else:
+            ranges.append((age_range, int(low), True))
+    
+    return tuple(ranges), open_ended
+
+
+def _age_label(age_months: int) -> Optional[str]:
+    """Wake window age range label for an age in months.
+    
+    Works like an if/elif ladder over the knowledge base ranges, so integral
+    floats such as 6.0 and fractional ages resolve the same way as ints.
+    """
+    ranges, open_ended = _age_ranges()
+    for label, month, exact in ranges:
+        if age_months == month if exact else age_months <= month:
+            return label
+    return open_ended
+
+
+@lru_cache(maxsize=64, typed=True)
+def _compute_baseline(age_months: int) -> Mapping[str, Any]:
+    """Baseline wake window lookup for an age, cached as a read-only mapping"""
+    # Determine age range string
+    age_str = _age_label(age_months)
+    
+    # Get data from knowledge base
+    kb = get_kb()
+    age_data = kb.get_age_specific_info(age_str) if age_str else None
+    
+    if age_data and age_data['wake_windows']:
+        wake_windows = age_data['wake_windows']
         
-        # Build comprehensive response
-        return {
+        # Range is parsed into minutes when the knowledge base loads
+        min_minutes, max_minutes, average_minutes = kb.get_wake_window_minutes(age_str)
+        return MappingProxyType({
             "status": "success",
-            "window_id": window_id,
-            "assessment": assessment,
-            "adjustment_minutes": adjustment_minutes,
-            "reason": reason,
-            "action": "shorten" if adjustment_minutes < 0 else "extend" if adjustment_minutes > 0 else "maintain",
-            "recommendation": f"{'Shorten' if adjustment_minutes < 0 else 'Extend' if adjustment_minutes > 0 else 'Maintain'} {window_id} wake window by {abs(adjustment_minutes)} minutes",
-            "details": {
-                "sleep_type": sleep_type,
-                "putdown_behavior": putdown_behavior,
-                "time_to_sleep": time_to_sleep_minutes,
-                "is_bedtime": is_bedtime,
-                "wake_mood": wake_mood,
-                "nap_duration": nap_duration_minutes,
-                "night_pattern": night_pattern,
-                "crying_before_offered": crying_before_offered
-            }
-        }
-        
-    except ValueError as e:
-        return {
-            "status": "error",
-            "error": f"Invalid input value: {str(e)}",
-            "window_id": window_id
-        }
-    except Exception as e:
-        return {
-            "status": "error",
-            "error": f"Assessment error: {str(e)}",
-            "window_id": window_id
-        }
+            "age_months": age_months,
+            "age_range": age_str,
+            "wake_window_range": wake_windows['wake_window'],
+            "min_minutes": min_minutes,
+            "max_minutes": max_minutes,
+            "average_minutes": average_minutes,
+            "number_of_naps": wake_windows['naps'],
+            "source": "sleep_knowledge_base"
+        })
+    else:
+        return MappingProxyType({
+            **_ERR_TEMPLATE,
+            "error": f"No wake window data found for {age_months} months",
+            "age_months": age_months
+        })
 
 
 def get_baseline_wake_windows(age_months: int) -> Dict[str, Any]:
@@ -214,72 +473,12 @@ def get_baseline_wake_windows(age_months: int) -> Dict[str, Any]:
         Dictionary with baseline wake window information
     """
     try:
-        kb = SleepKnowledgeBaseTool()
-        
-        # Determine age range string
-        if age_months <= 3:
-            age_str = "0-3 months"
-        elif age_months == 4:
-            age_str = "4 months"
-        elif age_months == 5:
-            age_str = "5 months"
-        elif age_months == 6:
-            age_str = "6 months"
-        elif age_months == 7:
-            age_str = "7 months"
-        elif age_months == 8:
-            age_str = "8 months"
-        elif age_months == 9:
-            age_str = "9 months"
-        elif age_months <= 12:
-            age_str = "10-12 months"
-        elif age_months <= 15:
-            age_str = "12-15 months"
-        elif age_months <= 18:
-            age_str = "15-18 months"
-        elif age_months <= 24:
-            age_str = "18-24 months"
-        else:
-            age_str = "24+ months"
-        
-        # Get data from knowledge base
-        age_data = kb.get_age_specific_info(age_str)
-        
-        if age_data and age_data['wake_windows']:
-            wake_window_str = age_data['wake_windows']['wake_window']
-            naps = age_data['wake_windows']['naps']
-            
-            # Parse wake window range
-            if '-' in wake_window_str:
-                parts = wake_window_str.replace(' minutes', '').split('-')
-                min_minutes = int(parts[0])
-                max_minutes = int(parts[1])
-            else:
-                # Single value
-                minutes = int(wake_window_str.replace(' minutes', ''))
-                min_minutes = max_minutes = minutes
-            
-            return {
-                "status": "success",
-                "age_months": age_months,
-                "age_range": age_str,
-                "wake_window_range": wake_window_str,
-                "min_minutes": min_minutes,
-                "max_minutes": max_minutes,
-                "average_minutes": (min_minutes + max_minutes) // 2,
-                "number_of_naps": naps,
-                "source": "sleep_knowledge_base"
-            }
-        else:
-            return {
-                "status": "error",
-                "error": f"No wake window data found for {age_months} months",
-                "age_months": age_months
-            }
+        # Return a plain dict copy of the cached result
+        return dict(_compute_baseline(age_months))
             
     except Exception as e:
         return {
-            "status": "error",
+            **_ERR_TEMPLATE,
             "error": f"Error retrieving baseline data: {str(e)}",
             "age_months": age_months
-        }
\ No newline at end of file
+        }
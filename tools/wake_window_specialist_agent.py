@@ -1,13 +1,11 @@
 """Wake Window Specialist Subagent"""
 
+from typing import Optional
 from google import adk
 from google.adk.tools import AgentTool
-import sys
-import os
 
 # Import our custom tools
-sys.path.append(os.path.dirname(__file__))
-from wake_window_tools import WAKE_WINDOW_TOOLS
+from .wake_window_tools import WAKE_WINDOW_TOOLS
 
 # Create the specialist subagent
 wake_window_specialist = adk.Agent(
@@ -86,13 +84,18 @@ wake_window_specialist = adk.Agent(
     tools=WAKE_WINDOW_TOOLS
 )
 
-# Create the tool wrapper for the main sleep agent
+# Tool wrapper for the main sleep agent, created on first request
+_SPECIALIST_TOOL: Optional[AgentTool] = None
+
+
 def create_wake_window_specialist_tool():
     """Create an AgentTool that wraps the wake window specialist subagent"""
+    global _SPECIALIST_TOOL
     
-    # Wrap the specialist as an AgentTool
-    specialist_tool = AgentTool(
-        agent=wake_window_specialist
-    )
+    # Wrap the specialist as an AgentTool once and share it between callers
+    if _SPECIALIST_TOOL is None:
+        _SPECIALIST_TOOL = AgentTool(
+            agent=wake_window_specialist
+        )
     
-    return specialist_tool
\ No newline at end of file
+    return _SPECIALIST_TOOL
\ No newline at end of file
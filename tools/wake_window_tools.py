@@ -1,21 +1,59 @@
 """Wake Window Calculator Tools - Individual Function Tools"""
 
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+from functools import lru_cache
 from google.adk.tools import FunctionTool, ToolContext
 import json
-import os
-import sys
+import math
 
-# Add parent directory to import knowledge base
-sys.path.append(os.path.dirname(__file__))
-from knowledge_base_tool import SleepKnowledgeBaseTool
-from wake_window_assessment_tool import (
+from .knowledge_base_tool import SleepKnowledgeBaseTool
+from .wake_window_assessment_tool import (
     SleepType, PutDownBehavior, WakeMood, NightSleepPattern,
     assess_wake_window_adjustment, get_baseline_wake_windows
 )
 
 
+# Time helpers - times are handled as integer minutes after midnight
+def _parse_hhmm(value: str) -> int:
+    """Parse a 24-hour HH:MM time into minutes after midnight.
+    
+    The single time parser for every calculator. Like strptime with "%H:%M",
+    it also accepts one-digit hours and minutes such as "7:05". Only ASCII
+    digits are accepted.
+    """
+    hours, _, minutes = value.partition(":")
+    if not (value.isascii() and hours.isdigit() and minutes.isdigit() and len(hours) <= 2 and len(minutes) <= 2):
+        raise ValueError(f"time data {value!r} does not match format '%H:%M'")
+    
+    hours, minutes = int(hours), int(minutes)
+    if hours > 23 or minutes > 59:
+        raise ValueError(f"time data {value!r} does not match format '%H:%M'")
+    return hours * 60 + minutes
+
+
+def _minutes_to_hhmm(minutes: float) -> str:
+    """Format minutes after midnight as HH:MM, wrapping past midnight.
+    
+    Fractional minutes are dropped, as strftime("%H:%M") did for datetimes.
+    """
+    minutes = math.floor(minutes) % 1440
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+@lru_cache(maxsize=1024)
+def _fmt_duration(minutes: int) -> str:
+    """Format a duration as "2h 15min", or "45min" when under an hour"""
+    if minutes >= 60:
+        return f"{minutes // 60}h {minutes % 60}min"
+    return f"{minutes}min"
+
+
+@lru_cache(maxsize=256)
+def _fmt_minutes(minutes: int) -> str:
+    """Format a number of minutes as "45min", as shown in the daily schedule"""
+    return f"{minutes}min"
+
+
 # Math calculation tools
 def calculate_sleep_duration(
     put_down_time: str, 
@@ -34,23 +72,18 @@ def calculate_sleep_duration(
     """
     try:
         # Parse times
-        put_down = datetime.strptime(put_down_time, "%H:%M")
-        wake_up = datetime.strptime(wake_up_time, "%H:%M")
-        
-        # Handle day boundary
-        if wake_up < put_down:
-            wake_up += timedelta(days=1)
+        put_down = _parse_hhmm(put_down_time)
+        wake_up = _parse_hhmm(wake_up_time)
         
-        # Calculate duration
-        duration_seconds = (wake_up - put_down).total_seconds()
-        duration_minutes = int(duration_seconds / 60)
+        # Calculate duration, wrapping past midnight
+        duration_minutes = (wake_up - put_down) % 1440
         
         # Format result
-        hours = duration_minutes // 60
-        minutes = duration_minutes % 60
-        formatted = f"{hours}h {minutes}min" if hours > 0 else f"{minutes}min"
+        formatted = _fmt_duration(duration_minutes)
         
-        # Store in context
+        # Store in context. Session state is persisted as JSON and only assignments
+        # are recorded as state changes, so results are stored as fresh plain dicts
+        # rather than objects mutated in place.
         tool_context.state["last_sleep_duration"] = {
             "put_down": put_down_time,
             "wake_up": wake_up_time,
@@ -88,14 +121,11 @@ def calculate_next_sleep_time(
         Dictionary with next sleep time
     """
     try:
-        wake = datetime.strptime(wake_time, "%H:%M")
-        next_sleep = wake + timedelta(minutes=wake_window_minutes)
-        next_sleep_time = next_sleep.strftime("%H:%M")
+        wake = _parse_hhmm(wake_time)
+        next_sleep_time = _minutes_to_hhmm(wake + wake_window_minutes)
         
         # Format wake window
-        hours = wake_window_minutes // 60
-        minutes = wake_window_minutes % 60
-        ww_formatted = f"{hours}h {minutes}min" if hours > 0 else f"{minutes}min"
+        ww_formatted = _fmt_duration(wake_window_minutes)
         
         tool_context.state["last_schedule_calculation"] = {
             "wake_time": wake_time,
@@ -140,8 +170,8 @@ def adjust_wake_window(
             new_window = 30
             
         # Format results
-        current_formatted = f"{current_window_minutes // 60}h {current_window_minutes % 60}min" if current_window_minutes >= 60 else f"{current_window_minutes}min"
-        new_formatted = f"{new_window // 60}h {new_window % 60}min" if new_window >= 60 else f"{new_window}min"
+        current_formatted = _fmt_duration(current_window_minutes)
+        new_formatted = _fmt_duration(new_window)
         
         action = "Extended" if adjustment_minutes > 0 else "Shortened"
         
@@ -167,6 +197,75 @@ def adjust_wake_window(
         }
 
 
+# Event kinds produced by _schedule_events
+_NAP, _NAP_WAKE, _BEDTIME = 0, 1, 2
+
+# Assumed nap durations in minutes, indexed by min(nap index, 1) - longer first nap
+_NAP_DURATIONS = (90, 60)
+
+
+def _schedule_events(start: int, wake_windows: List[int], nap_count: int) -> List[Tuple[int, int, int, int]]:
+    """Integer core of the daily schedule.
+    
+    Returns:
+        (kind, nap number, time in minutes after midnight, minutes) for each event
+        after the morning wake. Minutes is the wake window before a nap or bedtime,
+        or the nap duration for a wake from nap.
+    """
+    events = []
+    current_time = start
+    
+    # Calculate naps and bedtime
+    for i, ww_minutes in enumerate(wake_windows):
+        # Calculate next sleep time
+        sleep_time = current_time + ww_minutes
+        
+        if i < nap_count:
+            # It's a nap
+            events.append((_NAP, i + 1, sleep_time, ww_minutes))
+            
+            # Assume average nap duration (will be adjusted based on age)
+            nap_duration = _NAP_DURATIONS[min(i, 1)]
+            current_time = sleep_time + nap_duration
+            events.append((_NAP_WAKE, i + 1, current_time, nap_duration))
+        else:
+            # It's bedtime
+            events.append((_BEDTIME, 0, sleep_time, ww_minutes))
+            break
+    
+    return events
+
+
+def _format_schedule(wake_time: str, events: List[Tuple[int, int, int, int]]) -> List[Dict[str, str]]:
+    """Turn schedule events into the list of dicts returned to the agent"""
+    schedule = [{
+        "event": "Morning Wake",
+        "time": wake_time
+    }]
+    
+    for kind, number, time_minutes, minutes in events:
+        if kind == _NAP:
+            schedule.append({
+                "event": f"Nap {number}",
+                "time": _minutes_to_hhmm(time_minutes),
+                "wake_window": _fmt_minutes(minutes)
+            })
+        elif kind == _NAP_WAKE:
+            schedule.append({
+                "event": f"Wake from Nap {number}",
+                "time": _minutes_to_hhmm(time_minutes),
+                "duration": _fmt_minutes(minutes)
+            })
+        else:
+            schedule.append({
+                "event": "Bedtime",
+                "time": _minutes_to_hhmm(time_minutes),
+                "wake_window": _fmt_minutes(minutes)
+            })
+    
+    return schedule
+
+
 def calculate_daily_schedule(
     wake_time: str,
     wake_windows: List[int],
@@ -185,48 +284,8 @@ def calculate_daily_schedule(
         Dictionary with full day schedule
     """
     try:
-        schedule = []
-        current_time = datetime.strptime(wake_time, "%H:%M")
-        
-        # Morning wake
-        schedule.append({
-            "event": "Morning Wake",
-            "time": wake_time
-        })
-        
-        # Calculate naps and bedtime
-        for i in range(len(wake_windows)):
-            # Calculate next sleep time
-            ww_minutes = wake_windows[i]
-            sleep_time = current_time + timedelta(minutes=ww_minutes)
-            
-            if i < nap_count:
-                # It's a nap
-                schedule.append({
-                    "event": f"Nap {i+1}",
-                    "time": sleep_time.strftime("%H:%M"),
-                    "wake_window": f"{ww_minutes}min"
-                })
-                
-                # Assume average nap duration (will be adjusted based on age)
-                nap_duration = 90 if i == 0 else 60  # Longer first nap
-                wake_from_nap = sleep_time + timedelta(minutes=nap_duration)
-                
-                schedule.append({
-                    "event": f"Wake from Nap {i+1}",
-                    "time": wake_from_nap.strftime("%H:%M"),
-                    "duration": f"{nap_duration}min"
-                })
-                
-                current_time = wake_from_nap
-            else:
-                # It's bedtime
-                schedule.append({
-                    "event": "Bedtime",
-                    "time": sleep_time.strftime("%H:%M"),
-                    "wake_window": f"{ww_minutes}min"
-                })
-                break
+        events = _schedule_events(_parse_hhmm(wake_time), wake_windows, nap_count)
+        schedule = _format_schedule(wake_time, events)
         
         tool_context.state["daily_schedule"] = schedule
         
@@ -243,6 +302,45 @@ def calculate_daily_schedule(
         }
 
 
+def calculate_daily_schedules(
+    wake_time: str,
+    wake_window_options: List[List[int]],
+    nap_count: int
+) -> Dict[str, Any]:
+    """Calculate candidate day schedules for several sets of wake windows.
+    
+    Batch counterpart of calculate_daily_schedule for comparing wake window
+    adjustments side by side. The wake time is parsed once and every option
+    runs through the same integer schedule builder.
+    
+    Args:
+        wake_time: Morning wake time (HH:MM)
+        wake_window_options: Candidate lists of wake windows in minutes
+        nap_count: Number of naps expected
+        
+    Returns:
+        Dictionary with one schedule per wake window option, in order
+    """
+    try:
+        start = _parse_hhmm(wake_time)
+        schedules = [
+            _format_schedule(wake_time, _schedule_events(start, wake_windows, nap_count))
+            for wake_windows in wake_window_options
+        ]
+        
+        return {
+            "status": "success",
+            "schedules": schedules,
+            "total_schedules": len(schedules)
+        }
+        
+    except Exception as e:
+        return {
+            "status": "error",
+            "error": f"Schedule calculation error: {str(e)}"
+        }
+
+
 # Create FunctionTool instances - ADK gets name and description from function docstrings
 sleep_duration_tool = FunctionTool(func=calculate_sleep_duration)
 next_sleep_tool = FunctionTool(func=calculate_next_sleep_time)